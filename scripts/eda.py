@@ -13,10 +13,29 @@ This script performs:
 Author: Gokul Anand G
 Date: 2025-12-10
 """
+import argparse
 import os
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
+import matplotlib
+try:
+    import mplcairo.base  # noqa: F401  # pylint: disable=unused-import
+    # Cairo backend reuses its surface and font faces across figures
+    matplotlib.use("module://mplcairo.base", force=True)
+except ImportError:
+    matplotlib.use("Agg")  # Plots are only written to disk; skip GUI backend init
+from matplotlib import font_manager
 import matplotlib.pyplot as plt
 import seaborn as sns
+from scipy.stats import gaussian_kde
+
+try:
+    import pyarrow  # noqa: F401  # pylint: disable=unused-import
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 
 # =========================
@@ -24,12 +43,25 @@ import seaborn as sns
 # =========================
 plt.style.use("ggplot")
 sns.set(font_scale=1.1)
+font_manager.findfont("DejaVu Sans")  # Resolve the default font once up front
 
 # Absolute path for saving plots
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PLOT_DIR = os.path.join(BASE_DIR, "reports", "plots")
 os.makedirs(PLOT_DIR, exist_ok=True)
 
+# Histogram settings; the KDE overlay is fitted on a fixed-size random sample
+HIST_BINS = 30
+KDE_SAMPLE_SIZE = 5000
+
+# Date format used by the dataset (dd/mm/yyyy)
+DATE_FORMAT = "%d/%m/%Y"
+
+# savefig arguments: fast, light zlib for the per-column plots, full
+# optimization only for the summary plots
+SAVE_KW = {"dpi": 90, "pil_kwargs": {"compress_level": 1}}
+SUMMARY_SAVE_KW = {"pil_kwargs": {"optimize": True}}
+
 
 # =========================
 # LOAD DATA
@@ -38,114 +70,191 @@ def load_dataset(file_path: str = "data/dataset.csv") -> pd.DataFrame:
     """
     Load CSV dataset.
 
+    Columns whose name contains "date" are detected once, parsed to
+    datetime, and recorded in df.attrs['date_cols'].
+
     Args:
         file_path (str): Path to CSV file
 
     Returns:
         pd.DataFrame: Loaded dataframe
     """
-    df = pd.read_csv(file_path)
+    if HAS_PYARROW:
+        # Peek at the header so date columns are parsed during the Arrow read
+        header = pd.read_csv(file_path, nrows=0).columns
+        date_cols = [col for col in header if "date" in col.lower()]
+        df = pd.read_csv(file_path, engine="pyarrow", parse_dates=date_cols, date_format=DATE_FORMAT)
+    else:
+        df = pd.read_csv(file_path)
+        date_cols = [col for col in df.columns if "date" in col.lower()]
     print("\n Dataset loaded successfully!\n")
     print(df.head())
 
-    # Convert potential date column
-    for col in df.columns:
-        if "date" in col.lower():
-            df[col] = pd.to_datetime(df[col], dayfirst=True, errors='coerce')
+    # Convert potential date columns the reader left unparsed
+    unparsed = [col for col in date_cols if not pd.api.types.is_datetime64_any_dtype(df[col])]
+    if unparsed:
+        df[unparsed] = df[unparsed].apply(pd.to_datetime, dayfirst=True, errors='coerce')
+    df.attrs['date_cols'] = date_cols
     return df
 
 
+# =========================
+# NUMERIC PREPARATION
+# =========================
+def _prepare_numeric(df: pd.DataFrame) -> Tuple[pd.Index, np.ndarray]:
+    """
+    Select numeric columns and coerce them once into a float64 array.
+
+    Missing values are replaced with 0 in place, so every plotting
+    function can share the same array instead of re-coercing the frame.
+
+    Args:
+        df (pd.DataFrame): Dataframe
+
+    Returns:
+        Tuple[pd.Index, np.ndarray]: Numeric column names and their values
+    """
+    numeric_df = df.select_dtypes(include=np.number)
+    arr = numeric_df.to_numpy(dtype=np.float64, copy=False)
+    if not arr.flags.writeable:
+        # Copy-on-write frames hand out read-only views of float64 blocks
+        arr = arr.copy()
+    np.nan_to_num(arr, copy=False)
+    return numeric_df.columns, arr
+
+
 # =========================
 # DATA SUMMARY
 # =========================
-def summarize_dataset(df: pd.DataFrame) -> None:
+def summarize_dataset(df: pd.DataFrame, full: bool = False) -> None:
     """
     Print basic information, descriptive statistics, and missing values.
 
+    Statistics come from one pass of NumPy reductions over the numeric
+    block; the percentile-based describe() is only run when requested.
+
     Args:
         df (pd.DataFrame): Dataframe
+        full (bool): Print the full describe() table including percentiles
     """
     print("\n Dataset Info")
-    print(df.info())
+    print(f"{df.shape[0]} rows x {df.shape[1]} columns")
+    print(df.dtypes)
+
+    numeric_df = df.select_dtypes(include=np.number)
+    arr = numeric_df.to_numpy(dtype=np.float64)
+    nulls = np.isnan(arr).sum(axis=0)
 
     print("\n Descriptive Statistics")
-    print(df.describe().T)
+    # NaN-aware reductions have no identity on an empty frame; describe() copes
+    if full or arr.shape[0] == 0:
+        print(df.describe().T)
+    else:
+        stats = pd.DataFrame({
+            "count": arr.shape[0] - nulls,
+            "mean": np.nanmean(arr, axis=0),
+            "std": np.nanstd(arr, axis=0, ddof=1),
+            "min": np.nanmin(arr, axis=0),
+            "max": np.nanmax(arr, axis=0),
+        }, index=numeric_df.columns)
+        print(stats)
 
     print("\n Missing Values")
-    print(df.isna().sum())
+    missing = df.drop(columns=numeric_df.columns).isna().sum()
+    missing = pd.concat([missing, pd.Series(nulls, index=numeric_df.columns)])
+    print(missing.reindex(df.columns))
 
 
 # =========================
 # UNIVARIATE ANALYSIS
 # =========================
-def plot_histograms(df: pd.DataFrame) -> None:
+def plot_histograms(df: pd.DataFrame, numeric_cols: pd.Index, arr: np.ndarray) -> None:
     """
     Plot histograms for numeric columns and save to PLOT_DIR.
 
     Args:
         df (pd.DataFrame): Dataframe
+        numeric_cols (pd.Index): Numeric column names
+        arr (np.ndarray): Coerced numeric values, one column per name
     """
-    numeric_cols = df.select_dtypes(include=['number']).columns
-
-    # Ensure numeric columns are valid
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
-
-    for col in numeric_cols:
-        plt.figure(figsize=(7, 4))
-        sns.histplot(df[col], kde=True)
-        plt.title(f"Distribution of {col}")
-        plt.tight_layout()
-        plt.savefig(os.path.join(PLOT_DIR, f"{col}_hist.png"))
-        plt.close()
+    rng = np.random.default_rng(0)
+    fig, ax = plt.subplots(figsize=(7, 4))
+    for i, col in enumerate(numeric_cols):
+        ax.clear()
+        values = arr[:, i]
+        values = values[np.isfinite(values)]
+        counts, edges = np.histogram(values, bins=HIST_BINS)
+        ax.stairs(counts, edges, fill=True, alpha=0.6)
+
+        # KDE overlay scaled to counts; a constant sample (e.g. a mostly-zero
+        # column) has no density, so the overlay is skipped
+        sample = rng.choice(values, min(KDE_SAMPLE_SIZE, values.size), replace=False)
+        if sample.size > 1 and sample.min() < sample.max():
+            xs = np.linspace(edges[0], edges[-1], 200)
+            density = gaussian_kde(sample)(xs)
+            ax.plot(xs, density * values.size * (edges[1] - edges[0]))
+
+        ax.set_title(f"Distribution of {col}")
+        ax.set_xlabel(col)
+        ax.set_ylabel("Count")
+        fig.tight_layout()
+        fig.savefig(os.path.join(PLOT_DIR, f"{col}_hist.png"), **SAVE_KW)
+    plt.close(fig)
 
 
 # =========================
 # OUTLIER DETECTION
 # =========================
-def plot_boxplots(df: pd.DataFrame) -> None:
+def plot_boxplots(df: pd.DataFrame, numeric_cols: pd.Index, arr: np.ndarray) -> None:
     """
     Plot boxplots for numeric columns and save to PLOT_DIR.
 
     Args:
         df (pd.DataFrame): Dataframe
+        numeric_cols (pd.Index): Numeric column names
+        arr (np.ndarray): Coerced numeric values, one column per name
     """
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
-
-    for col in numeric_cols:
-        plt.figure(figsize=(5, 4))
-        sns.boxplot(x=df[col])
-        plt.title(f"Outlier Detection - {col}")
-        plt.tight_layout()
-        plt.savefig(os.path.join(PLOT_DIR, f"{col}_box.png"))
-        plt.close()
+    fig, ax = plt.subplots(figsize=(5, 4))
+    for i, col in enumerate(numeric_cols):
+        ax.clear()
+        sns.boxplot(x=arr[:, i], ax=ax)
+        ax.set_title(f"Outlier Detection - {col}")
+        ax.set_xlabel(col)
+        fig.tight_layout()
+        fig.savefig(os.path.join(PLOT_DIR, f"{col}_box.png"), **SAVE_KW)
+    plt.close(fig)
 
 
 # =========================
 # CORRELATION HEATMAP
 # =========================
-def plot_correlation_heatmap(df: pd.DataFrame) -> None:
+def plot_correlation_heatmap(df: pd.DataFrame, numeric_cols: pd.Index, arr: np.ndarray) -> None:
     """
     Plot correlation heatmap between numeric columns.
 
     Args:
         df (pd.DataFrame): Dataframe
+        numeric_cols (pd.Index): Numeric column names
+        arr (np.ndarray): Coerced numeric values, one column per name
     """
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+    # Constant columns have zero variance; leave their coefficients as NaN like DataFrame.corr
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # A single column yields a 0-d result; keep it a 1x1 matrix for the heatmap
+        corr = np.atleast_2d(np.corrcoef(arr, rowvar=False))
 
     plt.figure(figsize=(8, 6))
-    sns.heatmap(df[numeric_cols].corr(min_periods=1), annot=True, fmt=".2f", cmap="coolwarm")
+    sns.heatmap(corr, xticklabels=numeric_cols, yticklabels=numeric_cols,
+                annot=True, fmt=".2f", cmap="coolwarm")
     plt.title("Correlation Heatmap")
     plt.tight_layout()
-    plt.savefig(os.path.join(PLOT_DIR, "correlation_heatmap.png"))
+    plt.savefig(os.path.join(PLOT_DIR, "correlation_heatmap.png"), **SUMMARY_SAVE_KW)
     plt.close()
 
 
 # =========================
 # TREND PLOTS
 # =========================
-def plot_trends(df: pd.DataFrame) -> None:
+def plot_trends(df: pd.DataFrame, numeric_cols: pd.Index, arr: np.ndarray) -> None:
     """
     Plot clean trends for numeric columns using:
     - Monthly aggregated line plots
@@ -155,73 +264,95 @@ def plot_trends(df: pd.DataFrame) -> None:
 
     Args:
         df (pd.DataFrame): Dataset
+        numeric_cols (pd.Index): Numeric column names
+        arr (np.ndarray): Coerced numeric values, one column per name
     """
-    # Detect datetime column
-    datetime_cols = df.select_dtypes(include=['datetime64']).columns
-    if len(datetime_cols) == 0:
-        for col in df.columns:
-            if "date" in col.lower():
-                df[col] = pd.to_datetime(df[col], dayfirst=True, errors='coerce')
-                datetime_cols = [col]
-                break
+    # Date columns are detected and parsed once by load_dataset
+    datetime_cols = df.attrs.get('date_cols') or list(df.select_dtypes(include=['datetime64']).columns)
 
     if len(datetime_cols) == 0:
         print("\n⚠ No datetime column found. Skipping trend plots.\n")
         return
 
     time_col = datetime_cols[0]
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+
+    # Unparsed dates (NaT) are left out of every time-based aggregation
+    valid = df[time_col].notna().to_numpy()
+    if not valid.any():
+        print("\n⚠ No valid dates found. Skipping trend plots.\n")
+        return
+    dates = df.loc[valid, time_col]
+    values = arr[valid]
 
     # =========================
     # Monthly Aggregated Trend
     # =========================
-    df['Month'] = df[time_col].dt.to_period('M')
-    monthly_df = df.groupby('Month')[numeric_cols].sum()
+    # Dense int64 month key (year*12 + month-1); empty months sum to 0
+    month_key = dates.dt.year.to_numpy(dtype=np.int64) * 12 + dates.dt.month.to_numpy(dtype=np.int64) - 1
+    first_key = month_key.min()
+    month_keys = np.arange(first_key, month_key.max() + 1)
+    sums = np.zeros((month_keys.size, len(numeric_cols)), dtype=np.float64)
+    np.add.at(sums, month_key - first_key, values)
+    month_index = pd.DatetimeIndex(pd.to_datetime(
+        pd.DataFrame({'year': month_keys // 12, 'month': month_keys % 12 + 1, 'day': 1})
+    ))
+    monthly_df = pd.DataFrame(sums, index=month_index, columns=numeric_cols)
 
     # Smoothed Trend using rolling mean (window=3 months)
+    fig, ax = plt.subplots(figsize=(12,4))
     for col in numeric_cols:
-        plt.figure(figsize=(12,4))
-        plt.plot(monthly_df.index.to_timestamp(), monthly_df[col], marker='o', label='Monthly Sum')
-        plt.plot(monthly_df.index.to_timestamp(), monthly_df[col].rolling(window=3, min_periods=1).mean(),
-                 label='3-Month Rolling Mean', linewidth=2, color='red')
-        plt.title(f"Monthly Trend & Smoothed - {col}")
-        plt.xlabel('Month')
-        plt.ylabel(col)
-        plt.xticks(rotation=45)
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(os.path.join(PLOT_DIR, f"{col}_monthly_trend.png"))
-        plt.close()
+        ax.clear()
+        ax.plot(monthly_df.index, monthly_df[col], marker='o', label='Monthly Sum')
+        ax.plot(monthly_df.index, monthly_df[col].rolling(window=3, min_periods=1).mean(),
+                label='3-Month Rolling Mean', linewidth=2, color='red')
+        ax.set_title(f"Monthly Trend & Smoothed - {col}")
+        ax.set_xlabel('Month')
+        ax.set_ylabel(col)
+        ax.tick_params(axis='x', labelrotation=45)
+        ax.legend()
+        fig.tight_layout()
+        fig.savefig(os.path.join(PLOT_DIR, f"{col}_monthly_trend.png"), **SAVE_KW)
+    plt.close(fig)
 
     # =========================
     # Stacked Area Plot for all services
     # =========================
-    plt.figure(figsize=(12,6))
-    monthly_df.plot.area(figsize=(12,6))
-    plt.title("Stacked Area Plot - Monthly Passenger Trends")
-    plt.xlabel('Month')
-    plt.ylabel('Passengers')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig(os.path.join(PLOT_DIR, "stacked_area_trend.png"))
-    plt.close()
+    fig, ax = plt.subplots(figsize=(12,6))
+    ax.stackplot(monthly_df.index, monthly_df.to_numpy().T, labels=list(numeric_cols))
+    ax.legend(loc='upper left')
+    ax.set_title("Stacked Area Plot - Monthly Passenger Trends")
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Passengers')
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    fig.savefig(os.path.join(PLOT_DIR, "stacked_area_trend.png"), **SUMMARY_SAVE_KW)
+    plt.close(fig)
 
     # =========================
     # Weekly Heatmap per service
     # =========================
-    df['Week'] = df[time_col].dt.isocalendar().week
-    df['Weekday'] = df[time_col].dt.weekday
-
-    for col in numeric_cols:
-        pivot = df.pivot_table(index='Week', columns='Weekday', values=col, aggfunc='sum')
+    # Compute the calendar keys once as small ints
+    week = dates.dt.isocalendar().week.to_numpy(dtype=np.int8)
+    weekday = dates.dt.weekday.to_numpy(dtype=np.int8)
+
+    # ISO weeks (1-53) x weekdays (0-6) are dense, so scatter-add into a fixed grid;
+    # cells without any observation are masked like the empty cells of a pivot
+    seen = np.zeros((54, 7), dtype=np.int64)
+    np.add.at(seen, (week, weekday), 1)
+    empty = seen[1:] == 0
+    week_labels = np.arange(1, 54)
+    grid = np.zeros((54, 7), dtype=np.float64)
+
+    for i, col in enumerate(numeric_cols):
+        grid.fill(0)
+        np.add.at(grid, (week, weekday), values[:, i])
         plt.figure(figsize=(12,6))
-        sns.heatmap(pivot, cmap="YlGnBu")
+        sns.heatmap(pd.DataFrame(grid[1:], index=week_labels), mask=empty, cmap="YlGnBu")
         plt.title(f"Weekly Heatmap - {col}")
         plt.xlabel("Weekday (0=Monday)")
         plt.ylabel("Week Number")
         plt.tight_layout()
-        plt.savefig(os.path.join(PLOT_DIR, f"{col}_weekly_heatmap.png"))
+        plt.savefig(os.path.join(PLOT_DIR, f"{col}_weekly_heatmap.png"), **SAVE_KW)
         plt.close()
 
 
@@ -230,17 +361,22 @@ def plot_trends(df: pd.DataFrame) -> None:
 # =========================
 # MAIN FUNCTION
 # =========================
-def run_eda() -> None:
+def run_eda(file_path: str = "data/dataset.csv", full_summary: bool = False) -> None:
     """
     Run the full EDA process: load data, summarize, plot histograms, boxplots, correlation, trends.
+
+    Args:
+        file_path (str): Path to CSV file
+        full_summary (bool): Include percentiles in the descriptive statistics
     """
-    df = load_dataset()
+    df = load_dataset(file_path)
+    numeric_cols, arr = _prepare_numeric(df)
 
-    summarize_dataset(df)
-    plot_histograms(df)
-    plot_boxplots(df)
-    plot_correlation_heatmap(df)
-    plot_trends(df)
+    summarize_dataset(df, full=full_summary)
+    plot_histograms(df, numeric_cols, arr)
+    plot_boxplots(df, numeric_cols, arr)
+    plot_correlation_heatmap(df, numeric_cols, arr)
+    plot_trends(df, numeric_cols, arr)
 
     print("\n📊 EDA completed successfully!")
     print(f"✔ All plots saved in: {os.path.abspath(PLOT_DIR)}")
@@ -250,4 +386,8 @@ def run_eda() -> None:
 # ENTRY POINT
 # =========================
 if __name__ == "__main__":
-    run_eda()
+    parser = argparse.ArgumentParser(description="Run EDA on the passenger dataset.")
+    parser.add_argument("--full", action="store_true",
+                        help="print the full describe() table including percentiles")
+    args = parser.parse_args()
+    run_eda(full_summary=args.full)
@@ -13,7 +13,18 @@ Insights Covered:
 
 import os
 import sys
+from types import SimpleNamespace
+
+import numpy as np
 import pandas as pd
+import matplotlib
+try:
+    import mplcairo.base  # noqa: F401  # pylint: disable=unused-import
+    # Cairo backend reuses its surface and font faces across figures
+    matplotlib.use("module://mplcairo.base", force=True)
+except ImportError:
+    matplotlib.use("Agg")  # Plots are only written to disk; skip GUI backend init
+from matplotlib import font_manager
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -22,12 +33,16 @@ import seaborn as sns
 # =========================
 plt.style.use("ggplot")
 sns.set(font_scale=1.1)
+font_manager.findfont("DejaVu Sans")  # Resolve the default font once up front
 
 # Absolute path to project root
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PLOT_DIR = os.path.join(BASE_DIR, "reports", "plots", "insights")
 os.makedirs(PLOT_DIR, exist_ok=True)
 
+# savefig arguments: light zlib compression keeps PNG encoding cheap
+SAVE_KW = {"dpi": 90, "pil_kwargs": {"compress_level": 1}}
+
 # =========================
 # LOAD DATA
 # =========================
@@ -35,12 +50,22 @@ def load_data(path=None):
     """
     Load the public transport dataset dynamically.
 
+    Columns shared by several insight plots are derived once here so the
+    plotting functions read them directly instead of adding columns to df.
+
     Args:
         path (str): Path to the CSV file containing the dataset. 
                     If None, prompts the user.
 
     Returns:
-        pd.DataFrame: Dataset with 'Date' converted to datetime.
+        SimpleNamespace: Loaded data with attributes:
+            df (pd.DataFrame): Dataset with 'Date' converted to datetime.
+            school_zero (pd.Categorical): True on days with no School service
+                (None without a 'School' column).
+            weekday (np.ndarray): int8 weekday (0=Monday, -1 if Date is missing;
+                None without a 'Date' column).
+            day_type (pd.Categorical): 'Weekday' / 'Weekend' for each row
+                (None without a 'Date' column).
     """
     if path is None:
         path = input("Enter path to dataset CSV file: ").strip()
@@ -50,42 +75,53 @@ def load_data(path=None):
 
     df = pd.read_csv(path)
 
+    # Fill missing numeric values with 0 for plotting
+    numeric_cols = df.select_dtypes(include=np.number).columns
+    df[numeric_cols] = df[numeric_cols].fillna(0)
+
+    data = SimpleNamespace(df=df, school_zero=None, weekday=None, day_type=None)
+
     # Ensure Date column is datetime
     if 'Date' in df.columns:
         df['Date'] = pd.to_datetime(df['Date'], dayfirst=True, errors='coerce')
+        data.weekday = df['Date'].dt.weekday.to_numpy(dtype=np.int8, na_value=-1)
+        codes = (data.weekday >= 5).astype(np.int8)
+        codes[data.weekday < 0] = -1  # Unparsed dates stay missing
+        data.day_type = pd.Categorical.from_codes(codes, categories=['Weekday', 'Weekend'])
 
-    # Fill missing numeric values with 0 for plotting
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
-    df[numeric_cols] = df[numeric_cols].fillna(0)
+    if 'School' in df.columns:
+        data.school_zero = pd.Categorical(df['School'].to_numpy() == 0, categories=[False, True])
 
-    return df
+    return data
 
 # =========================
 # INSIGHT PLOTS
 # =========================
 
-def plot_school_substitution(df):
+def plot_school_substitution(data):
     """
     Insight 1: School Service Substitution
     Plot Local Route passenger counts on days when School service is zero vs non-zero.
     """
-    df['School_zero'] = df['School'] == 0
+    if data.school_zero is None:
+        raise KeyError("'School' column is required for the school substitution plot")
     plt.figure(figsize=(8,5))
-    sns.boxplot(x='School_zero', y='Local Route', data=df)
+    sns.boxplot(x=data.school_zero, y=data.df['Local Route'])
     plt.xticks([0,1], ['School > 0','School = 0'])
     plt.title('Local Route Usage vs School Service Availability')
     plt.ylabel('Local Route Passengers')
     plt.tight_layout()
     filepath = os.path.join(PLOT_DIR, "school_substitution.png")
-    plt.savefig(filepath)
+    plt.savefig(filepath, **SAVE_KW)
     plt.close()
     print(f"✅ Saved plot: {filepath}")
 
-def plot_rapid_overflow(df):
+def plot_rapid_overflow(data):
     """
     Insight 2: Rapid Route Overflow
     Scatter plot showing Rapid Route usage vs Local Route to identify overflow patterns.
     """
+    df = data.df
     plt.figure(figsize=(8,5))
     sns.scatterplot(x='Local Route', y='Rapid Route', data=df)
     sns.regplot(x='Local Route', y='Rapid Route', data=df, scatter=False, color='red')
@@ -94,50 +130,54 @@ def plot_rapid_overflow(df):
     plt.ylabel('Rapid Route Passengers')
     plt.tight_layout()
     filepath = os.path.join(PLOT_DIR, "rapid_overflow.png")
-    plt.savefig(filepath)
+    plt.savefig(filepath, **SAVE_KW)
     plt.close()
     print(f"✅ Saved plot: {filepath}")
 
-def plot_underutilized_services(df):
+def plot_underutilized_services(data):
     """
     Insight 3: Underutilized Services
     Histogram of Peak Service and School to highlight zero-count days (low utilization).
     """
+    df = data.df
     plt.figure(figsize=(8,5))
-    sns.histplot(df['Peak Service'], bins=30, color='blue', alpha=0.5, label='Peak Service')
-    sns.histplot(df['School'], bins=30, color='green', alpha=0.5, label='School')
+    for col, color in (('Peak Service', 'blue'), ('School', 'green')):
+        counts, edges = np.histogram(df[col].to_numpy(), bins=30)
+        plt.stairs(counts, edges, fill=True, color=color, alpha=0.5, label=col)
     plt.title('Distribution of Passenger Counts (Highlighting Zero-Count Days)')
     plt.xlabel('Passengers')
     plt.ylabel('Frequency')
     plt.legend()
     plt.tight_layout()
     filepath = os.path.join(PLOT_DIR, "underutilized_services.png")
-    plt.savefig(filepath)
+    plt.savefig(filepath, **SAVE_KW)
     plt.close()
     print(f"✅ Saved plot: {filepath}")
 
-def plot_weekday_weekend_divergence(df):
+def plot_weekday_weekend_divergence(data):
     """
     Insight 4: Weekday vs Weekend Divergence
     Boxplot of Peak Service passenger counts for weekdays vs weekends.
     """
-    df['Weekday'] = df['Date'].dt.weekday
-    df['Day Type'] = df['Weekday'].apply(lambda x: 'Weekend' if x>=5 else 'Weekday')
+    if data.day_type is None:
+        raise KeyError("'Date' column is required for the weekday/weekend plot")
     plt.figure(figsize=(8,5))
-    sns.boxplot(x='Day Type', y='Peak Service', data=df)
+    sns.boxplot(x=data.day_type, y=data.df['Peak Service'])
     plt.title('Peak Service Usage: Weekday vs Weekend')
+    plt.xlabel('Day Type')
     plt.ylabel('Passengers')
     plt.tight_layout()
     filepath = os.path.join(PLOT_DIR, "weekday_weekend_divergence.png")
-    plt.savefig(filepath)
+    plt.savefig(filepath, **SAVE_KW)
     plt.close()
     print(f"✅ Saved plot: {filepath}")
 
-def plot_mode_shift_extreme_events(df):
+def plot_mode_shift_extreme_events(data):
     """
     Insight 5: Passenger Mode Shift During Extreme Weather/Events
     Line plot of 'Other' service usage highlighting extreme spikes.
     """
+    df = data.df
     plt.figure(figsize=(10,5))
     plt.plot(df['Date'], df['Other'], marker='o', linestyle='-', color='orange')
     plt.title('Other Service Usage Highlighting Extreme Spikes')
@@ -146,7 +186,7 @@ def plot_mode_shift_extreme_events(df):
     plt.xticks(rotation=45)
     plt.tight_layout()
     filepath = os.path.join(PLOT_DIR, "mode_shift_extreme_events.png")
-    plt.savefig(filepath)
+    plt.savefig(filepath, **SAVE_KW)
     plt.close()
     print(f"✅ Saved plot: {filepath}")
 
@@ -160,12 +200,12 @@ def generate_insight_plots(path=None):
     Args:
         path (str): Path to the dataset CSV. If None, prompts user.
     """
-    df = load_data(path)
-    plot_school_substitution(df)
-    plot_rapid_overflow(df)
-    plot_underutilized_services(df)
-    plot_weekday_weekend_divergence(df)
-    plot_mode_shift_extreme_events(df)
+    data = load_data(path)
+    plot_school_substitution(data)
+    plot_rapid_overflow(data)
+    plot_underutilized_services(data)
+    plot_weekday_weekend_divergence(data)
+    plot_mode_shift_extreme_events(data)
     print(f"🎉 All insight plots saved successfully in: {os.path.abspath(PLOT_DIR)}")
 
 # =========================